@@ -38,12 +38,20 @@ class DirectoryReadTask:
         self.path = path
         self.done_event = asyncio.Event()
         self.directory_listing: list[Path] = []
+        self.directory_names: set[str] = set()
         self._task: asyncio.Task | None = None
 
     def read(self) -> None:
         # TODO: Should this be cancellable, or have a maximum number of paths for the case of very large directories?
-        for path in self.path.iterdir():
-            self.directory_listing.append(path)
+        # Classify directories here (in a thread), so the caller doesn't need to stat.
+        with os.scandir(self.path) as scan:
+            for entry in scan:
+                self.directory_listing.append(Path(entry.path))
+                try:
+                    if entry.is_dir():
+                        self.directory_names.add(entry.name)
+                except OSError:
+                    pass
 
     def start(self) -> None:
         asyncio.create_task(self.run(), name=f"DirectoryReadTask({str(self.path)!r})")
@@ -62,7 +70,6 @@ class PathComplete:
 
     def __init__(self) -> None:
         self.read_tasks: dict[Path, DirectoryReadTask] = {}
-        self.directory_listings: dict[Path, list[Path]] = {}
 
     async def __call__(
         self,
@@ -70,7 +77,18 @@ class PathComplete:
         path: str,
         *,
         exclude_type: Literal["file"] | Literal["dir"] | None = None,
-    ) -> tuple[str | None, list[str] | None]:
+    ) -> tuple[str | None, list[tuple[str, bool]] | None]:
+        """Complete a path.
+
+        Args:
+            current_working_directory: Directory relative paths are resolved against.
+            path: The (partial) path to complete.
+            exclude_type: Exclude files or directories from the results.
+
+        Returns:
+            A tuple of the text to complete (or `None`), and a list of
+                `(suggestion, is_directory)` tuples (or `None`).
+        """
         current_working_directory = (
             current_working_directory.expanduser().resolve().absolute()
         )
@@ -81,26 +99,31 @@ class PathComplete:
             node = directory_path.name
             directory_path = directory_path.parent
 
-        if (listing := self.directory_listings.get(directory_path)) is None:
-            read_task = DirectoryReadTask(directory_path)
-            self.read_tasks[directory_path] = read_task
-            read_task.start()
-            listing = await read_task.wait()
+        read_task = DirectoryReadTask(directory_path)
+        self.read_tasks[directory_path] = read_task
+        read_task.start()
+        listing = await read_task.wait()
+        directory_names = read_task.directory_names
 
         if exclude_type is not None:
             if exclude_type == "dir":
                 listing = [
                     listing_path
                     for listing_path in listing
-                    if not listing_path.is_dir()
+                    if listing_path.name not in directory_names
                 ]
             else:
                 listing = [
-                    listing_path for listing_path in listing if listing_path.is_dir()
+                    listing_path
+                    for listing_path in listing
+                    if listing_path.name in directory_names
                 ]
 
         if not node:
-            return None, [listing_path.name for listing_path in listing]
+            return None, [
+                (listing_path.name, listing_path.name in directory_names)
+                for listing_path in listing
+            ]
 
         matching_nodes = [
             listing_path
@@ -123,12 +146,14 @@ class PathComplete:
             len(str(Path(directory_path).expanduser().resolve())) + 1 + len(node)
         )
         completed_prefix = str(picked_path)[path_size:]
+        option_offset = path_size + len(completed_prefix)
         path_options = [
-            str(path)[path_size + len(completed_prefix) :] for path in matching_nodes
+            (str(path)[option_offset:], path.name in directory_names)
+            for path in matching_nodes
         ]
-        path_options = [name for name in path_options if name]
+        path_options = [option for option in path_options if option[0]]
 
-        if picked_path.is_dir() and not path_options:
+        if prefix in directory_names and not path_options:
             completed_prefix += os.sep
 
         return completed_prefix or None, path_options
@@ -138,7 +138,7 @@ class MainScreen(Screen, can_focus=False):
             )
             for entry in message.entries
         ]
-        self.query_one("SideBar Plan", Plan).entries = entries
+        self.query_one("SideBar Plan", Plan).update_entries(entries)
 
     def on_mount(self) -> None:
         for tree in self.query("#project_directory_tree").results(DirectoryTree):
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING
 from textual.message import Message
 
 from toad.shell_read import shell_read
+from toad.shell_write import shell_write
 
 from toad.widgets.terminal import Terminal
 
@@ -71,6 +72,8 @@ class Shell:
 
         self._finished: bool = False
         self._ready_event: asyncio.Event = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        """Serializes writes, so they aren't interleaved (or lost) when the pty is full."""
 
         self._hide_echo: set[bytes] = set()
         """A set of byte strings to remove from output."""
@@ -117,7 +120,8 @@ class Shell:
         text_bytes = text.encode("utf-8", "ignore") if isinstance(text, str) else text
         if hide_echo:
             self._hide_echo.add(text_bytes)
-        return await asyncio.to_thread(os.write, self.master, text_bytes)
+        async with self._write_lock:
+            return await shell_write(self.master, text_bytes)
 
     async def run(self) -> None:
         current_directory = self.working_directory
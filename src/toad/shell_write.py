@@ -0,0 +1,42 @@
+import asyncio
+import os
+
+
+def _set_writable(writable: asyncio.Future[None]) -> None:
+    if not writable.done():
+        writable.set_result(None)
+
+
+async def shell_write(fd: int, data: bytes) -> int:
+    """Write all of the data to a non-blocking file descriptor (typically a pty).
+
+    A non-blocking write may accept only part of the data, or none of it if the
+    buffer is full. This writes the remainder once the descriptor is writable again.
+
+    The event loop has a single writer callback per descriptor, so callers must not
+    write to the same descriptor concurrently (hold a lock around this call).
+
+    Args:
+        fd: File descriptor.
+        data: Bytes to write.
+
+    Returns:
+        Number of bytes written.
+    """
+    loop = asyncio.get_running_loop()
+    view = memoryview(data)
+    written = 0
+    try:
+        while written < len(view):
+            try:
+                written += os.write(fd, view[written:])
+            except BlockingIOError:
+                writable = loop.create_future()
+                loop.add_writer(fd, _set_writable, writable)
+                try:
+                    await writable
+                finally:
+                    loop.remove_writer(fd)
+    finally:
+        view.release()
+    return written
@@ -16,9 +16,6 @@ from textual.style import Style
 from toad._loop import loop_last
 
 
-from textual._profile import timer
-
-
 @rich.repr.auto
 class Row(Visual):
     """A visual for a row produced by `columns`.
@@ -150,6 +147,25 @@ class Columns:
         self._render_cache.clear()
         return Row(self, len(self.rows) - 1)
 
+    def set_cell(self, row_index: int, column_index: int, cell: Content | str) -> Row:
+        """Replace the content of a single cell.
+
+        Args:
+            row_index: Index of the row.
+            column_index: Index of the column.
+            cell: New cell content.
+
+        Returns:
+            A new Row renderable for the updated row.
+        """
+        self.rows[row_index][column_index] = (
+            cell if isinstance(cell, Content) else Content(cell)
+        )
+        self._optimal_width_cache = None
+        self._last_render = None
+        self._render_cache.clear()
+        return Row(self, row_index)
+
     def render(
         self, row_index: int, render_width: int, style: Style = Style.null()
     ) -> list[Strip]:
@@ -13,6 +13,7 @@ from textual import events
 from textual.message import Message
 
 from toad.shell_read import shell_read
+from toad.shell_write import shell_write
 
 from toad.widgets.terminal import Terminal
 
@@ -39,6 +40,7 @@ class CommandPane(Terminal):
         self._execute_task: asyncio.Task | None = None
         self._return_code: int | None = None
         self._master: int | None = None
+        self._write_lock = asyncio.Lock()
         super().__init__(name=name, id=id, classes=classes)
 
     @property
@@ -85,7 +87,8 @@ class CommandPane(Terminal):
             return 0
         text_bytes = text.encode("utf-8", "ignore") if isinstance(text, str) else text
         try:
-            return await asyncio.to_thread(os.write, self._master, text_bytes)
+            async with self._write_lock:
+                return await shell_write(self._master, text_bytes)
         except OSError:
             return 0
 
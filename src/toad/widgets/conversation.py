@@ -714,7 +714,7 @@ class Conversation(containers.Vertical):
         if self.contents.children and isinstance(
             (current_plan := self.contents.children[-1]), Plan
         ):
-            current_plan.entries = entries
+            current_plan.update_entries(entries)
         else:
             await self.post(Plan(entries))
 
@@ -81,44 +81,41 @@ class GridSelect(containers.ItemGrid, can_focus=True):
     def on_blur(self) -> None:
         self.highlighted = None
 
+    def _current_widget(self) -> Widget | None:
+        """Get the highlighted widget.
+
+        Returns:
+            The highlighted child, or `None` if nothing is highlighted.
+        """
+        highlighted = self.highlighted
+        children = self.children
+        if highlighted is not None and 0 <= highlighted < len(children):
+            return children[highlighted]
+        return None
+
     def reveal_highlight(self):
-        if self.highlighted is None:
+        if (highlighted_widget := self._current_widget()) is None:
             return
-        try:
-            highlighted_widget = self.children[self.highlighted]
-        except IndexError:
-            pass
-        else:
-            if not self.screen.can_view_entire(highlighted_widget):
-                self.screen.scroll_to_center(highlighted_widget, origin_visible=True)
+        if not self.screen.can_view_entire(highlighted_widget):
+            self.screen.scroll_to_center(highlighted_widget, origin_visible=True)
 
     def watch_highlighted(
         self, old_highlighted: int | None, highlighted: int | None
     ) -> None:
-        if old_highlighted is not None:
-            try:
-                self.children[old_highlighted].remove_class("-highlight")
-            except IndexError:
-                pass
-        if highlighted is not None:
-            try:
-                highlighted_widget = self.children[highlighted]
-                highlighted_widget.add_class("-highlight")
-            except IndexError:
-                pass
+        children = self.children
+        if old_highlighted is not None and 0 <= old_highlighted < len(children):
+            children[old_highlighted].remove_class("-highlight")
+        if highlighted is not None and 0 <= highlighted < len(children):
+            children[highlighted].add_class("-highlight")
         self.reveal_highlight()
 
     def validate_highlighted(self, highlighted: int | None) -> int | None:
-        if highlighted is None:
+        child_count = len(self.children)
+        if not child_count or highlighted is None:
             return None
-
-        if not self.children:
-            return None
-        if highlighted < 0:
-            return 0
-        if highlighted >= len(self.children):
-            return len(self.children) - 1
-        return highlighted
+        if 0 <= highlighted < child_count:
+            return highlighted
+        return 0 if highlighted < 0 else child_count - 1
 
     def action_cursor_up(self):
         if (grid_size := self.grid_size) is None:
@@ -163,29 +160,25 @@ class GridSelect(containers.ItemGrid, can_focus=True):
         if event.widget is None:
             return
 
-        highlighted_widget: Widget | None = None
-        if self.highlighted is not None:
-            try:
-                highlighted_widget = self.children[self.highlighted]
-            except IndexError:
-                pass
-        for widget in event.widget.ancestors_with_self:
-            if widget in self.children:
-                if highlighted_widget is not None and highlighted_widget is widget:
-                    self.action_select()
-                else:
-                    self.highlighted = self.children.index(widget)
-                break
+        highlighted_widget = self._current_widget()
+        clicked_widget = next(
+            (
+                widget
+                for widget in event.widget.ancestors_with_self
+                if widget.parent is self
+            ),
+            None,
+        )
+        if clicked_widget is not None:
+            if highlighted_widget is clicked_widget:
+                self.action_select()
+            else:
+                self.highlighted = self.children.index(clicked_widget)
         self.focus()
 
     def action_select(self):
-        if self.highlighted is not None:
-            try:
-                highlighted_widget = self.children[self.highlighted]
-            except IndexError:
-                pass
-            else:
-                self.post_message(self.Selected(self, highlighted_widget))
+        if (highlighted_widget := self._current_widget()) is not None:
+            self.post_message(self.Selected(self, highlighted_widget))
 
 
 if __name__ == "__main__":
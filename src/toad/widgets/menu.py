@@ -104,6 +104,7 @@ class Menu(ListView, can_focus=True):
     def __init__(self, owner: Widget, options: list[MenuItem], *args, **kwargs) -> None:
         self._owner = owner
         self._options = options
+        self._dismissed = False
         super().__init__(*args, **kwargs)
 
     def _insert_options(self) -> None:
@@ -126,11 +127,18 @@ class Menu(ListView, can_focus=True):
         action = self._options[index].action
         self.post_message(self.OptionSelected(self, self._owner, action))
 
-    async def action_dismiss(self) -> None:
+    def _dismiss(self) -> None:
+        """Post a Dismissed message, at most once."""
+        if self._dismissed:
+            return
+        self._dismissed = True
         self.post_message(self.Dismissed(self))
 
+    async def action_dismiss(self) -> None:
+        self._dismiss()
+
     async def on_blur(self) -> None:
-        self.post_message(self.Dismissed(self))
+        self._dismiss()
 
     @on(events.Key)
     async def on_key(self, event: events.Key) -> None:
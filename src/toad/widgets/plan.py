@@ -3,7 +3,6 @@ from dataclasses import dataclass
 from textual.app import ComposeResult
 from textual.content import Content
 from textual.layout import Layout
-from textual.reactive import reactive
 from textual import containers
 from textual.widgets import Static
 
@@ -52,7 +51,7 @@ class Plan(containers.Grid):
 
     """
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class Entry:
         """Information about an entry in the Plan."""
 
@@ -60,8 +59,6 @@ class Plan(containers.Grid):
         priority: str
         status: str
 
-    entries: reactive[list[Entry] | None] = reactive(None, recompose=True)
-
     LEFT = Content.styled("▌", "$error-muted on transparent r")
 
     PRIORITIES = {
@@ -77,13 +74,20 @@ class Plan(containers.Grid):
         id: str | None = None,
         classes: str | None = None,
     ):
-        self.newly_completed: set[Plan.Entry] = set()
+        self.entries = entries
+        self._newly_completed_ids: set[int] = set()
+        self._rows: list[tuple[Plan.Entry, Static, StrikeText]] = []
         super().__init__(name=name, id=id, classes=classes)
-        self.set_reactive(Plan.entries, entries)
 
-    def watch_entries(self, old_entries: list[Entry], new_entries: list[Entry]) -> None:
+    def update_entries(self, new_entries: list[Entry]) -> None:
+        """Update the plan, patching only the rows which have changed.
+
+        Args:
+            new_entries: New plan entries.
+        """
+        old_entries = self.entries
         entry_map = {entry.content: entry for entry in old_entries}
-        newly_completed: set[Plan.Entry] = set()
+        newly_completed_ids: set[int] = set()
         for entry in new_entries:
             old_entry = entry_map.get(entry.content, None)
             if (
@@ -91,27 +95,75 @@ class Plan(containers.Grid):
                 and entry.status == "completed"
                 and entry.status != old_entry.status
             ):
-                newly_completed.add(entry)
-        self.newly_completed = newly_completed
+                newly_completed_ids.add(id(entry))
+        self._newly_completed_ids = newly_completed_ids
+        self.entries = new_entries
+
+        if not old_entries or not new_entries:
+            # Switching to or from the "No plan yet" placeholder
+            self._rows.clear()
+            self.refresh(recompose=True)
+            return
+
+        rows = self._rows
+        for index, (entry, (old_entry, status, strike_text)) in enumerate(
+            zip(new_entries, rows)
+        ):
+            rows[index] = (entry, status, strike_text)
+            if entry == old_entry:
+                continue
+            old_classes = self._get_row_classes(old_entry)
+            new_classes = self._get_row_classes(entry)
+            for widget in (status, strike_text):
+                widget.remove_class(*old_classes)
+                widget.add_class(*new_classes)
+            status.update(self.render_status(entry.status))
+            strike_text.update(entry.content)
+            if id(entry) in newly_completed_ids:
+                strike_text.strike()
+            elif entry.status != "completed":
+                strike_text.reset_strike()
+
+        if len(new_entries) > len(rows):
+            new_widgets: list[Static | StrikeText] = []
+            for entry in new_entries[len(rows) :]:
+                status, strike_text = self._make_row(entry)
+                rows.append((entry, status, strike_text))
+                new_widgets.extend((status, strike_text))
+                if id(entry) in newly_completed_ids:
+                    self.call_after_refresh(strike_text.strike)
+            self.mount_all(new_widgets)
+        elif len(new_entries) < len(rows):
+            for _entry, status, strike_text in rows[len(new_entries) :]:
+                status.remove()
+                strike_text.remove()
+            del rows[len(new_entries) :]
+
+    @classmethod
+    def _get_row_classes(cls, entry: Entry) -> tuple[str, str]:
+        return (f"priority-{entry.priority}", f"status-{entry.status}")
+
+    def _make_row(self, entry: Entry) -> tuple[Static, StrikeText]:
+        """Make the widgets for a single plan entry."""
+        classes = " ".join(self._get_row_classes(entry))
+        status = NonSelectableStatic(
+            self.render_status(entry.status),
+            classes=f"status {classes}",
+        )
+        strike_text = StrikeText(entry.content, classes=f"plan {classes}")
+        return status, strike_text
 
     def compose(self) -> ComposeResult:
+        self._rows.clear()
         if not self.entries:
             yield Static("No plan yet", classes="-no-plan")
             return
         for entry in self.entries:
-            classes = f"priority-{entry.priority} status-{entry.status}"
-            yield NonSelectableStatic(
-                self.render_status(entry.status),
-                classes=f"status {classes}",
-            )
-
-            yield (
-                strike_text := StrikeText(
-                    entry.content,
-                    classes=f"plan {classes}",
-                )
-            )
-            if entry in self.newly_completed or (
+            status, strike_text = self._make_row(entry)
+            self._rows.append((entry, status, strike_text))
+            yield status
+            yield strike_text
+            if id(entry) in self._newly_completed_ids or (
                 not self.is_mounted and entry.status == "completed"
             ):
                 self.call_after_refresh(strike_text.strike)
@@ -174,7 +226,7 @@ if __name__ == "__main__":
             yield Plan(entries)
 
         def action_strike(self) -> None:
-            self.query_one(Plan).entries = new_entries
+            self.query_one(Plan).update_entries(new_entries)
 
     app = PlanApp()
     app.run()
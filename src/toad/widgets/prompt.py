@@ -1,8 +1,11 @@
+from bisect import bisect_left
+from functools import cached_property
+import os
 from pathlib import Path
 import shlex
-from typing import Callable, Literal, Self
+from typing import Callable, ClassVar, Literal, NamedTuple, Self
 
-from textual import on
+from textual import on, work
 from textual.reactive import var, Initialize
 from textual.app import ComposeResult
 
@@ -16,7 +19,8 @@ from textual.widgets import OptionList, TextArea, Label
 from textual import containers
 from textual.widget import Widget
 from textual.widgets.option_list import Option
-from textual.widgets.text_area import Selection
+from textual.widgets.text_area import EditResult, Selection
+from textual.timer import Timer
 from textual import events
 
 from toad.app import ToadApp
@@ -32,6 +36,121 @@ from toad.slash_command import SlashCommand
 from toad.prompt.extract import extract_paths_from_prompt
 from toad.acp.agent import Mode
 from toad.path_complete import PathComplete
+from toad.visuals.columns import Columns
+
+
+_SPACE_ESCAPE = str.maketrans({" ": "\\ "})
+"""Translation table to escape spaces in shell tokens."""
+
+
+def _count_backslashes(text: str, index: int) -> int:
+    """Count the backslashes immediately preceding an index.
+
+    Args:
+        text: Text to scan.
+        index: Index to scan backwards from.
+
+    Returns:
+        Number of consecutive backslashes.
+    """
+    count = 0
+    while index > count and text[index - count - 1] == "\\":
+        count += 1
+    return count
+
+
+def _shell_split(text: str) -> list[str]:
+    """Split a shell command line, as `shlex.split` would, without raising.
+
+    A line that is still being typed may have an unbalanced quote or a trailing
+    backslash, which `shlex.split` rejects. These are closed (or dropped) before
+    splitting, so the last token is what the user has typed so far.
+
+    Args:
+        text: A shell command line.
+
+    Returns:
+        A list of tokens.
+    """
+    try:
+        return shlex.split(text)
+    except ValueError:
+        pass
+    stripped = text.removesuffix("\\")
+    for candidate in (stripped, stripped + '"', stripped + "'"):
+        try:
+            return shlex.split(candidate)
+        except ValueError:
+            pass
+    return text.split()
+
+
+def _last_shell_token(text: str) -> str:
+    """Get the last token of a shell command line, as `shlex.split` would.
+
+    Scans backwards from the end of the text, so the cost is proportional to the
+    length of the last token rather than the whole line. Falls back to splitting
+    the whole line if it contains quotes, which may also be unbalanced.
+
+    Args:
+        text: A shell command line.
+
+    Returns:
+        The last token, or empty string if there are no tokens.
+    """
+    end = len(text.rstrip())
+    if end < len(text) and _count_backslashes(text, end) % 2:
+        # Trailing whitespace was escaped, and belongs to the token
+        end += 1
+    position = end
+    while position > 0:
+        character = text[position - 1]
+        if character in "'\"":
+            tokens = _shell_split(text)
+            return tokens[-1] if tokens else ""
+        if character.isspace() and not _count_backslashes(text, position - 1) % 2:
+            break
+        position -= 1
+    if "'" in text[:position] or '"' in text[:position]:
+        # The whitespace may be within quotes, which only a full split can tell
+        tokens = _shell_split(text)
+        return tokens[-1] if tokens else ""
+    token = text[position:end]
+    if "\\" in token:
+        tokens = _shell_split(token)
+        token = tokens[0] if tokens else ""
+    return token
+
+
+class _TextFacts(NamedTuple):
+    """Facts about the prompt text, required on every edit."""
+
+    multi_line: bool
+    """Text contains a newline or a code fence."""
+    has_space: bool
+    """Text contains a space."""
+    is_blank: bool
+    """Text is empty or only whitespace."""
+    first_token: str
+    """Text up to the first space."""
+
+
+def _scan_text(text: str) -> _TextFacts:
+    """Gather facts about the prompt text, without repeated scans.
+
+    Args:
+        text: Prompt text.
+
+    Returns:
+        Facts about the text.
+    """
+    first_token, space, _ = text.partition(" ")
+    return _TextFacts(
+        "\n" in text or "```" in text,
+        bool(space),
+        not text or text.isspace(),
+        first_token,
+    )
 
 
 class ModeSwitcher(OptionList):
@@ -107,6 +226,19 @@ class PromptTextArea(HighlightedTextArea):
         ),
     ]
 
+    SHELL_TRIGGER_CHARACTERS: ClassVar[frozenset[str]] = frozenset("!$")
+    """Characters which switch to shell mode when typed at the start of the prompt."""
+
+    SUGGESTION_DELAY = 0.02
+    """Delay (in seconds) after the last edit before updating the suggestion."""
+
+    ACTION_CHECKS: ClassVar[dict[str, Callable[["PromptTextArea"], bool | None]]] = {
+        "newline": lambda text_area: not text_area.multi_line,
+        "submit": lambda text_area: not text_area.multi_line,
+        "multiline_submit": lambda text_area: text_area.multi_line,
+    }
+    """Checks for actions which depend on state (actions not listed are always enabled)."""
+
     app = getters.app(ToadApp)
 
     auto_completes: var[list[Option]] = var(list)
@@ -114,7 +246,7 @@ class PromptTextArea(HighlightedTextArea):
     shell_mode = var(False, bindings=True)
     agent_ready: var[bool] = var(False)
     path_complete: var[PathComplete] = var(Initialize(lambda obj: PathComplete()))
-    suggestions: var[list[str] | None] = var(None)
+    suggestions: var[list[tuple[str, bool]] | None] = var(None)
     suggestions_index: var[int] = var(0)
 
     project_path = var(Path())
@@ -122,6 +254,7 @@ class PromptTextArea(HighlightedTextArea):
 
     slash_commands: var[list[SlashCommand]] = var([])
     slash_command_prefixes: var[tuple[str, ...]] = var(())
+    slash_command_names: var[frozenset[str]] = var(frozenset())
 
     class Submitted(Message):
         def __init__(self, markdown: str) -> None:
@@ -135,24 +268,20 @@ class PromptTextArea(HighlightedTextArea):
         pass
 
     def watch_slash_commands(self, slash_commands: list[SlashCommand]) -> None:
-        """A tuple of slash commands for performance reasons (used with `str.startswith`)."""
+        """A tuple of slash commands for performance reasons (used with `str.startswith`),
+        and a set for exact lookups."""
         self.slash_command_prefixes = tuple(
             [slash_command.command for slash_command in slash_commands]
         )
+        self.slash_command_names = frozenset(self.slash_command_prefixes)
 
     def highlight_slash_command(self, text: str) -> Content:
         """Override slash command highlighting."""
-
-        if text.startswith(self.slash_command_prefixes):
-            content = Content(text)
-            for slash_command in self.slash_commands:
-                if text.startswith(slash_command.command + " "):
-                    content = content.stylize(
-                        "$text-success", 0, len(slash_command.command)
-                    )
-                    break
-            return content
-        return Content(text)
+        content = Content(text)
+        command, space, _ = text.partition(" ")
+        if space and command in self.slash_command_names:
+            content = content.stylize("$text-success", 0, len(command))
+        return content
 
     def highlight_shell(self, text: str) -> Content:
         """Override shell highlighting with additional danger detection."""
@@ -169,43 +298,112 @@ class PromptTextArea(HighlightedTextArea):
         content = content.add_spans(spans)
         return content
 
+    def __init__(
+        self,
+        text: str = "",
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+        placeholder: str | Content = "",
+    ):
+        self._path_spans: dict[int, tuple[str, list[int], list[int]]] = {}
+        self._suggestion_timer: Timer | None = None
+        self._path_suggestion: tuple[str, bool] | None = None
+        super().__init__(
+            text,
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+            placeholder=placeholder,
+        )
+
+    @cached_property
+    def _prompt(self) -> "Prompt":
+        """The parent prompt (resolved on first access)."""
+        return self.query_ancestor(Prompt)
+
+    @property
+    def suggestion_is_dir(self) -> bool | None:
+        """Is the current suggestion a directory? `None` if not known."""
+        if self._path_suggestion is None:
+            return None
+        suggestion, is_dir = self._path_suggestion
+        return is_dir if suggestion == self.suggestion else None
+
+    def _set_path_suggestion(self, path_suggestion: tuple[str, bool]) -> None:
+        """Set the suggestion from a path completion.
+
+        Args:
+            path_suggestion: A tuple of the suggestion, and whether it is a directory.
+        """
+        self._cancel_suggestion_update()
+        self._path_suggestion = path_suggestion
+        self.suggestion = path_suggestion[0]
+
     def on_mount(self) -> None:
         self.highlight_cursor_line = False
         self.hide_suggestion_on_blur = False
 
     def on_key(self, event: events.Key) -> None:
-        if (
-            not self.shell_mode
+        if self.shell_mode:
+            if event.key == "tab":
+                event.prevent_default()
+                return
+        elif (
+            event.character in self.SHELL_TRIGGER_CHARACTERS
             and self.cursor_location == (0, 0)
-            and event.character in {"!", "$"}
         ):
             self.post_message(self.RequestShellMode())
             event.prevent_default()
-        elif self.shell_mode and event.key == "tab":
-            event.prevent_default()
-        else:
-            self.suggestions = None
-            self.suggestion = ""
+            return
+        self.suggestions = None
+        character = event.character
+        if event.is_printable and character and self.suggestion.startswith(character):
+            # The edit will trim the suggestion, and the debounced update refresh it
+            return
+        self._cancel_suggestion_update()
+        self.suggestion = ""
+
+    def clear(self) -> EditResult:
+        result = super().clear()
+        self._cancel_suggestion_update()
+        self.suggestion = ""
+        return result
+
+    def _cancel_suggestion_update(self) -> None:
+        """Cancel a pending (debounced) suggestion update."""
+        if self._suggestion_timer is not None:
+            self._suggestion_timer.stop()
+            self._suggestion_timer = None
 
     def update_suggestion(self) -> None:
-        prompt = self.query_ancestor(Prompt)
+        # Coalesce bursts of edits in to a single update
+        if self._suggestion_timer is not None:
+            self._suggestion_timer.stop()
+        self._suggestion_timer = self.set_timer(
+            self.SUGGESTION_DELAY, self._update_suggestion
+        )
+
+    def _update_suggestion(self) -> None:
+        self._suggestion_timer = None
+        prompt = self._prompt
+        text = self.text
 
-        if self.selection.start == self.selection.end and self.text.startswith("/"):
+        if self.selection.start == self.selection.end and text.startswith("/"):
             return
 
-        if self.shell_mode and self.cursor_at_end_of_text and "\n" not in self.text:
+        if self.shell_mode and self.cursor_at_end_of_text and "\n" not in text:
             if prompt.complete_callback is not None:
-                if completes := prompt.complete_callback(self.text):
+                if completes := prompt.complete_callback(text):
                     self.suggestion = completes[-1]
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
-        if action == "newline" and self.multi_line:
-            return False
-        if action == "submit" and self.multi_line:
-            return False
-        if action == "multiline_submit":
-            return self.multi_line
-        return True
+        if (check := self.ACTION_CHECKS.get(action)) is None:
+            return True
+        return check(self)
 
     def action_multiline_submit(self) -> None:
         if not self.agent_ready:
@@ -233,20 +431,23 @@ class PromptTextArea(HighlightedTextArea):
                 )
             )
             return
-        if self.suggestion:
-            if " " not in self.text:
-                self.insert(self.suggestion + " ")
+        text = self.text
+        if suggestion := self.suggestion:
+            if " " not in text:
+                self.insert(suggestion + " ")
             else:
-                prompt = self.query_ancestor(Prompt)
-                last_token = shlex.split(self.text + self.suggestion)[-1]
-                last_token_path = Path(prompt.working_directory) / last_token
-                if last_token_path.is_dir():
-                    self.insert(self.suggestion)
+                if (is_dir := self.suggestion_is_dir) is None:
+                    # Not from path completion (e.g. history), so we need to check
+                    last_token = _last_shell_token(text + suggestion)
+                    is_dir = (Path(self.working_directory) / last_token).is_dir()
+                if is_dir:
+                    self.insert(suggestion)
                 else:
-                    self.insert(self.suggestion + " ")
+                    self.insert(suggestion + " ")
+                self._cancel_suggestion_update()
                 self.suggestion = ""
             return
-        self.post_message(UserInputSubmitted(self.text, self.shell_mode))
+        self.post_message(UserInputSubmitted(text, self.shell_mode))
         self.clear()
 
     def action_cursor_up(self, select: bool = False):
@@ -272,52 +473,60 @@ class PromptTextArea(HighlightedTextArea):
             return
         return super().action_delete_left()
 
-    async def action_tab_complete(self) -> None:
+    def action_tab_complete(self) -> None:
         if not self.shell_mode:
             return
 
-        import shlex
-
-        prompt = self.query_ancestor(Prompt)
-
         if not self.cursor_at_end_of_text:
             return
 
-        _cursor_row, cursor_column = prompt.prompt_text_area.selection.end
-        pre_complete = self.text[:cursor_column]
-        post_complete = self.text[cursor_column:]
-        shlex_tokens = shlex.split(pre_complete)
-        if not shlex_tokens:
+        self._tab_complete()
+
+    @work(exclusive=True, group="tab_complete")
+    async def _tab_complete(self) -> None:
+        """Complete the path under the cursor.
+
+        Runs in a worker so that reading the directory doesn't hold up the prompt.
+        """
+        text = self.text
+        _cursor_row, cursor_column = self.selection.end
+        pre_complete = text[:cursor_column]
+        post_complete = text[cursor_column:]
+        if not pre_complete.strip():
             return
 
-        command = shlex_tokens[0]
+        command = pre_complete.split(None, 1)[0]
+        last_token = _last_shell_token(pre_complete)
 
         exclude_node_type: Literal["file"] | Literal["dir"] | None = None
-        if (
-            command
-            in self.app.settings.get("shell.directory_commands", str).splitlines()
-        ):
+        if command in self._prompt.shell_directory_commands:
             exclude_node_type = "file"
-        elif command in self.app.settings.get("shell.file_commands", str).splitlines():
+        elif command in self._prompt.shell_file_commands:
             exclude_node_type = "dir"
 
         tab_complete, suggestions = await self.path_complete(
-            Path(prompt.working_directory),
-            shlex_tokens[-1],
+            Path(self.working_directory),
+            last_token,
             exclude_type=exclude_node_type,
         )
+        if self.text != text:
+            # The prompt was edited while reading the directory
+            return
 
         if tab_complete is not None:
+            # Only lex the full line when it needs to be rewritten
+            shlex_tokens = _shell_split(pre_complete)
             shlex_tokens = shlex_tokens[:-1] + [shlex_tokens[-1] + tab_complete]
-            path_component = Path(prompt.working_directory) / shlex_tokens[-1]
-            if path_component.is_file():
+            # A unique match that isn't a directory (which would end with a
+            # separator) is a file, so no need to stat it again.
+            if not suggestions and not tab_complete.endswith(os.sep):
                 spaces = " "
             else:
                 spaces = ""
 
             self.clear()
             self.insert(
-                " ".join(token.replace(" ", "\\ ") for token in shlex_tokens)
+                " ".join([token.translate(_SPACE_ESCAPE) for token in shlex_tokens])
                 + post_complete
                 + spaces
             )
@@ -327,12 +536,38 @@ class PromptTextArea(HighlightedTextArea):
                 self.suggestions = suggestions or None
                 self.suggestions_index = 0
                 if suggestions:
-                    self.suggestion = suggestions[0]
+                    self._set_path_suggestion(suggestions[0])
             elif self.suggestions:
                 self.suggestions_index = (self.suggestions_index + 1) % len(
                     self.suggestions
                 )
-                self.suggestion = self.suggestions[self.suggestions_index]
+                self._set_path_suggestion(self.suggestions[self.suggestions_index])
+
+    @on(TextArea.Changed)
+    def _clear_path_spans(self) -> None:
+        self._path_spans.clear()
+
+    def _get_path_spans(self, row: int, line: str) -> tuple[list[int], list[int]]:
+        """Get the spans of paths (@ syntax) in a line, cached per row.
+
+        Args:
+            row: Row index.
+            line: Text of the line.
+
+        Returns:
+            A tuple of sorted start offsets, and the corresponding end offsets.
+        """
+        if (cached := self._path_spans.get(row)) is not None:
+            cached_line, starts, ends = cached
+            if cached_line == line:
+                return starts, ends
+        starts = []
+        ends = []
+        for _path, start, end in extract_paths_from_prompt(line):
+            starts.append(start)
+            ends.append(end)
+        self._path_spans[row] = (line, starts, ends)
+        return starts, ends
 
     def watch_selection(
         self, previous_selection: Selection, selection: Selection
@@ -358,21 +593,21 @@ class PromptTextArea(HighlightedTextArea):
                 return
 
             if y == 0 and line and line[0] == "/" and direction == -1:
-                if line in self.slash_command_prefixes:
+                if line in self.slash_command_names:
                     self.selection = Selection((0, 0), (0, len(line)))
                     return
 
-            for _path, start, end in extract_paths_from_prompt(line):
-                if x > start and x < end:
-                    self.selection = Selection((y, start), (y, end))
-                    break
-                if direction == -1 and x == end:
-                    self.selection = Selection((y, start), (y, end))
-                    break
+            starts, ends = self._get_path_spans(y, line)
+            # Paths don't overlap, so only the last path starting before the
+            # cursor may contain it
+            if (index := bisect_left(starts, x) - 1) >= 0:
+                end = ends[index]
+                if x < end or (direction == -1 and x == end):
+                    self.selection = Selection((y, starts[index]), (y, end))
 
             if x > 0 and x <= len(line) and line[x - 1] == "@":
-                remaining_line = line[x + 1 :]
-                if not remaining_line or remaining_line[0].isspace():
+                # Check the following character in place, rather than slicing the line
+                if x + 1 >= len(line) or line[x + 1].isspace():
                     self.post_message(InvokeFileSearch())
 
 
@@ -386,6 +621,26 @@ class Prompt(containers.VerticalGroup):
     PROMPT_AI = Content.styled("❯", "$text-secondary")
     PROMPT_MULTILINE = Content.styled("☰", "$text-secondary")
 
+    PLACEHOLDER_SHELL = Content.from_markup(
+        "Enter shell command\t[r]▌esc▐[/r] prompt mode"
+    ).expand_tabs(8)
+    PLACEHOLDER_AI = Content.assemble(
+        "What would you like to do?\t".expandtabs(8),
+        ("▌!▐", "r"),
+        " shell ",
+        ("▌/▐", "r"),
+        " commands ",
+        ("▌@▐", "r"),
+        " files",
+    )
+    MODE_CURRENT = Content.styled("✔", "$text-success")
+
+    CACHED_SETTINGS = {
+        "shell.allow_commands": "shell_allow_commands",
+        "shell.directory_commands": "shell_directory_commands",
+        "shell.file_commands": "shell_file_commands",
+    }
+
     prompt_container = getters.query_one("#prompt-container", Widget)
     prompt_text_area = getters.query_one(PromptTextArea)
     prompt_label = getters.query_one("#prompt", Label)
@@ -395,6 +650,16 @@ class Prompt(containers.VerticalGroup):
     question = getters.query_one(Question)
     mode_switcher = getters.query_one(ModeSwitcher)
 
+    @cached_property
+    def _agent_info_label(self) -> AgentInfo:
+        """The agent info label (resolved on first access)."""
+        return self.query_one(AgentInfo)
+
+    @cached_property
+    def _mode_info_label(self) -> ModeInfo:
+        """The mode info label (resolved on first access)."""
+        return self.query_one(ModeInfo)
+
     slash_commands: var[list[SlashCommand]] = var(list)
     shell_mode = var(False)
     multi_line = var(False)
@@ -423,6 +688,12 @@ class Prompt(containers.VerticalGroup):
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self.ask_queue: list[Ask] = []
         self.complete_callback = complete_callback
+        self._rendered_modes: dict[Mode, tuple[Content, Content]] = {}
+        self._mode_columns: Columns | None = None
+        self._mode_columns_modes: dict[str, Mode] | None = None
+        self._mode_index: dict[str, int] = {}
+        self._checked_mode_id: str | None = None
+        self._prompt_update_pending = False
 
     @property
     def text(self) -> str:
@@ -435,6 +706,33 @@ class Prompt(containers.VerticalGroup):
             self.prompt_text_area.get_cursor_line_end_location()
         )
 
+    @cached_property
+    def shell_allow_commands(self) -> frozenset[str]:
+        """Commands which switch to shell mode (from the `shell.allow_commands` setting)."""
+        return frozenset(
+            self.app.settings.get("shell.allow_commands", expect_type=str).split()
+        )
+
+    @cached_property
+    def shell_directory_commands(self) -> frozenset[str]:
+        """Commands which take directories (from the `shell.directory_commands` setting)."""
+        return frozenset(
+            self.app.settings.get("shell.directory_commands", str).splitlines()
+        )
+
+    @cached_property
+    def shell_file_commands(self) -> frozenset[str]:
+        """Commands which take files (from the `shell.file_commands` setting)."""
+        return frozenset(self.app.settings.get("shell.file_commands", str).splitlines())
+
+    def on_mount(self) -> None:
+        self.app.settings_changed_signal.subscribe(self, self._settings_changed)
+
+    def _settings_changed(self, setting_item: tuple[str, object]) -> None:
+        key, _value = setting_item
+        if (attribute := self.CACHED_SETTINGS.get(key)) is not None:
+            self.__dict__.pop(attribute, None)
+
     def on_mouse_up(self) -> None:
         if not self.has_focus:
             self.focus()
@@ -446,8 +744,40 @@ class Prompt(containers.VerticalGroup):
                 "[b]$description[/]\n\n[dim](click to open mode switcher)",
                 description=mode.description,
             )
-            self.query_one(ModeInfo).with_tooltip(tooltip).update(mode.name)
-        self.watch_modes(self.modes)
+            self._mode_info_label.with_tooltip(tooltip).update(mode.name)
+        if not self._update_current_mode(mode):
+            self.watch_modes(self.modes)
+
+    def _update_current_mode(self, mode: Mode | None) -> bool:
+        """Move the current mode check mark, without rebuilding the mode switcher.
+
+        Args:
+            mode: The new current mode.
+
+        Returns:
+            `True` if the mode switcher was updated, or `False` if it requires a rebuild.
+        """
+        columns = self._mode_columns
+        if (
+            columns is None
+            or self.modes is not self._mode_columns_modes
+            or mode is None
+            or self._checked_mode_id is None
+            or (new_index := self._mode_index.get(mode.id)) is None
+            or (old_index := self._mode_index.get(self._checked_mode_id)) is None
+        ):
+            return False
+        mode_switcher = self.mode_switcher
+        if old_index != new_index:
+            mode_switcher.replace_option_prompt_at_index(
+                old_index, columns.set_cell(old_index, 0, "")
+            )
+            mode_switcher.replace_option_prompt_at_index(
+                new_index, columns.set_cell(new_index, 0, self.MODE_CURRENT)
+            )
+            self._checked_mode_id = mode.id
+        mode_switcher.highlighted = new_index
+        return True
 
     def ask(self, ask: Ask) -> None:
         """Replace the textarea prompt with a menu of options.
@@ -464,49 +794,66 @@ class Prompt(containers.VerticalGroup):
         self.mode_switcher.focus()
 
     def watch_modes(self, modes: dict[str, Mode] | None) -> None:
-        from toad.visuals.columns import Columns
-
         columns = Columns("auto", "auto", "flex")
         if modes is not None:
             mode_list = sorted(modes.values(), key=lambda mode: mode.name.lower())
             for mode in mode_list:
                 columns.add_row(
                     (
-                        Content.styled("✔", "$text-success")
+                        self.MODE_CURRENT
                         if self.current_mode and mode.id == self.current_mode.id
                         else ""
                     ),
-                    Content.from_markup("[bold]$mode[/]", mode=mode.name),
-                    Content.styled(mode.description or "", "dim"),
+                    *self.render_mode(mode),
                 )
         else:
             mode_list = []
 
+        self._mode_columns = columns
+        self._mode_columns_modes = modes
+        self._mode_index = {mode.id: index for index, mode in enumerate(mode_list)}
+        self._checked_mode_id = None
         self.mode_switcher.set_options(
             [Option(row, id=mode.id) for row, mode in zip(columns, mode_list)]
         )
         if self.current_mode is not None:
-            self.mode_switcher.highlighted = self.mode_switcher.get_option_index(
-                self.current_mode.id
+            self.mode_switcher.highlighted = self._mode_index.get(self.current_mode.id)
+            if self.mode_switcher.highlighted is not None:
+                self._checked_mode_id = self.current_mode.id
+
+    def render_mode(self, mode: Mode) -> tuple[Content, Content]:
+        """Render the name and description columns for a mode (cached).
+
+        Args:
+            mode: The mode.
+
+        Returns:
+            A tuple of `Content` for the name and description.
+        """
+        if (rendered := self._rendered_modes.get(mode)) is None:
+            rendered = self._rendered_modes[mode] = (
+                Content.from_markup("[bold]$mode[/]", mode=mode.name),
+                Content.styled(mode.description or "", "dim"),
             )
+        return rendered
 
     def watch_agent_ready(self, ready: bool) -> None:
         self.set_class(not ready, "-not-ready")
         if ready:
             # self.prompt_text_area.focus()
-            self.query_one(AgentInfo).update(self.agent_info)
+            self._agent_info_label.update(self.agent_info)
 
     def watch_agent_info(self, agent_info: Content) -> None:
         if self.agent_ready:
-            self.query_one(AgentInfo).update(agent_info)
+            self._agent_info_label.update(agent_info)
         else:
-            self.query_one(AgentInfo).update("Initializing…")
+            self._agent_info_label.update("Initializing…")
 
-    def watch_multiline(self) -> None:
-        self.update_prompt()
+    def watch_multi_line(self) -> None:
+        self.schedule_prompt_update()
 
     def watch_shell_mode(self) -> None:
-        self.update_prompt()
+        self.schedule_prompt_update()
 
     def watch_working_directory(self, working_directory: str) -> None:
         out_of_bounds = not Path(working_directory).is_relative_to(self.project_path)
@@ -531,14 +878,22 @@ class Prompt(containers.VerticalGroup):
             self.question.update(ask)
             self.question.focus()
 
+    def schedule_prompt_update(self) -> None:
+        """Update the prompt after the current event has been handled.
+
+        Multiple requests made while handling an event result in a single update.
+        """
+        if not self._prompt_update_pending:
+            self._prompt_update_pending = True
+            self.call_later(self.update_prompt)
+
     def update_prompt(self):
         """Update the prompt according to the current mode."""
+        self._prompt_update_pending = False
         if self.shell_mode:
             self.prompt_label.update(self.PROMPT_SHELL, layout=False)
             self.add_class("-shell-mode")
-            self.prompt_text_area.placeholder = Content.from_markup(
-                "Enter shell command\t[r]▌esc▐[/r] prompt mode"
-            ).expand_tabs(8)
+            self.prompt_text_area.placeholder = self.PLACEHOLDER_SHELL
             self.prompt_text_area.highlight_language = "shell"
         else:
             self.prompt_label.update(
@@ -547,32 +902,25 @@ class Prompt(containers.VerticalGroup):
             )
             self.remove_class("-shell-mode")
 
-            self.prompt_text_area.placeholder = Content.assemble(
-                "What would you like to do?\t".expandtabs(8),
-                ("▌!▐", "r"),
-                " shell ",
-                ("▌/▐", "r"),
-                " commands ",
-                ("▌@▐", "r"),
-                " files",
-            )
+            self.prompt_text_area.placeholder = self.PLACEHOLDER_AI
             self.prompt_text_area.highlight_language = "markdown"
 
     @property
     def likely_shell(self) -> bool:
-        text = self.prompt_text_area.text
-        if "\n" in text or " " in text or not text.strip():
-            return False
+        return self._likely_shell(_scan_text(self.prompt_text_area.text))
 
-        shell_commands = {
-            command.strip()
-            for command in self.app.settings.get(
-                "shell.allow_commands", expect_type=str
-            ).split()
-        }
-        if text.split(" ", 1)[0] in shell_commands:
-            return True
-        return False
+    def _likely_shell(self, facts: _TextFacts) -> bool:
+        """Check if the text is likely a shell command.
+
+        Args:
+            facts: Facts about the prompt text.
+
+        Returns:
+            `True` if the text is a single word in the shell allow list.
+        """
+        if facts.multi_line or facts.has_space or facts.is_blank:
+            return False
+        return facts.first_token in self.shell_allow_commands
 
     @property
     def is_shell_mode(self) -> bool:
@@ -582,13 +930,11 @@ class Prompt(containers.VerticalGroup):
         if self._ask is not None:
             self.question.focus()
         else:
-            self.query(HighlightedTextArea).focus()
+            self.prompt_text_area.focus()
         return self
 
     def append(self, text: str) -> None:
-        self.query_one(HighlightedTextArea).insert(
-            text, maintain_selection_offset=False
-        )
+        self.prompt_text_area.insert(text, maintain_selection_offset=False)
 
     def watch_show_path_search(self, show: bool) -> None:
         self.prompt_text_area.suggestion = ""
@@ -599,18 +945,18 @@ class Prompt(containers.VerticalGroup):
     @on(PromptTextArea.RequestShellMode)
     def on_request_shell_mode(self, event: PromptTextArea.RequestShellMode):
         self.shell_mode = True
-        self.update_prompt()
+        self.schedule_prompt_update()
 
     @on(TextArea.Changed)
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
-        text = event.text_area.text
+        facts = _scan_text(event.text_area.text)
 
-        self.multi_line = "\n" in text or "```" in text
+        self.multi_line = facts.multi_line
 
-        if not self.multi_line and self.likely_shell:
+        if self._likely_shell(facts):
             self.shell_mode = True
 
-        self.update_prompt()
+        self.schedule_prompt_update()
 
     @on(PromptTextArea.CancelShell)
     def on_cancel_shell(self, event: PromptTextArea.CancelShell):
@@ -651,16 +997,13 @@ class Prompt(containers.VerticalGroup):
     @on(messages.InsertPath)
     def on_insert_path(self, event: messages.InsertPath) -> None:
         event.stop()
-        if " " in event.path:
-            path = f'"{event.path}"'
-        else:
-            path = event.path
-            if (
-                self.prompt_text_area.get_text_range(*self.prompt_text_area.selection)
-                != " "
-            ):
-                path += " "
-        self.prompt_text_area.insert(path)
+        text_area = self.prompt_text_area
+        path = event.path
+        if " " in path:
+            path = f'"{path}"'
+        elif text_area.get_text_range(*text_area.selection) != " ":
+            path += " "
+        text_area.insert(path)
 
     @on(Question.Answer)
     def on_question_answer(self, event: Question.Answer) -> None:
@@ -680,8 +1023,12 @@ class Prompt(containers.VerticalGroup):
         self.set_timer(0.3, remove_question)
 
     def suggest(self, suggestion: str) -> None:
-        if suggestion.startswith(self.text) and self.text != suggestion:
-            self.prompt_text_area.suggestion = suggestion[len(self.text) :]
+        if not suggestion:
+            return
+        text_area = self.prompt_text_area
+        text = text_area.text
+        if len(suggestion) > len(text) and suggestion.startswith(text):
+            text_area.suggestion = suggestion[len(text) :]
 
     def compose(self) -> ComposeResult:
         yield PathSearch().data_bind(root=Prompt.project_path)
@@ -8,8 +8,10 @@ from textual import events, on
 from textual.binding import Binding
 from textual import containers
 from textual.content import Content
+from textual.css.query import NoMatches
 from textual.reactive import var, reactive
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Label
 
@@ -89,16 +91,37 @@ class Option(containers.HorizontalGroup):
         self.content = content
         self.key = key
 
+    @classmethod
+    def render_key(cls, key: str | None) -> Content:
+        """Render the key column.
+
+        Args:
+            key: Key, or `None` for no key.
+
+        Returns:
+            Content for the key label.
+        """
+        return Content.styled(f"{key}", "b") if key else Content(" ")
+
     def compose(self) -> ComposeResult:
-        key = self.key
         yield NonSelectableLabel("❯", id="caret")
-        if key:
-            yield NonSelectableLabel(Content.styled(f"{key}", "b"), id="index")
-        else:
-            yield NonSelectableLabel(Content(" "), id="index")
-
+        yield NonSelectableLabel(self.render_key(self.key), id="index")
         yield NonSelectableLabel(self.content, id="label")
 
+    def update(self, content: Content, key: str | None) -> None:
+        """Update the option in place.
+
+        Args:
+            content: New label content.
+            key: New key, or `None` for no key.
+        """
+        if key != self.key:
+            self.key = key
+            self.query_one("#index", Label).update(self.render_key(key))
+        if content != self.content:
+            self.content = content
+            self.query_one("#label", Label).update(content)
+
     def on_click(self, event: events.Click) -> None:
         event.stop()
         self.post_message(self.Selected(self.index))
@@ -211,28 +234,104 @@ class Question(Widget, can_focus=True):
         disabled: bool = False,
     ):
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._option_widgets: list[Option] = []
+        self._active_option: Option | None = None
+        self._blink_timer: Timer | None = None
         self.set_reactive(Question.question, question)
         self.set_reactive(Question.options, options or [])
 
     def on_mount(self) -> None:
         def toggle_blink() -> None:
-            if self.has_focus:
-                self.blink = not self.blink
-            else:
-                self.blink = False
-
-        self._blink_timer = self.set_interval(0.5, toggle_blink)
+            self.blink = not self.blink
+
+        # Only runs while the caret is visible, see `_update_blink_timer`
+        self._blink_timer = self.set_interval(0.5, toggle_blink, pause=True)
+        self._update_blink_timer()
+
+    def _update_blink_timer(self, focused: bool | None = None) -> None:
+        """Run the blink timer only while focused, with a selection still to make.
+
+        Args:
+            focused: Focus state, or `None` to use `has_focus`.
+        """
+        if self._blink_timer is None:
+            return
+        if focused is None:
+            focused = self.has_focus
+        if focused and not self.selected:
+            self._blink_timer.resume()
+        else:
+            self._blink_timer.pause()
+            self.blink = False
 
     def _reset_blink(self) -> None:
         self.blink = False
-        self._blink_timer.reset()
+        # Resetting would also resume a paused timer
+        if self._blink_timer is not None and self.has_focus and not self.selected:
+            self._blink_timer.reset()
+
+    def on_focus(self) -> None:
+        # Called before `has_focus` is updated
+        self._update_blink_timer(True)
+
+    def on_blur(self) -> None:
+        self._update_blink_timer(False)
+
+    def watch_selected(self) -> None:
+        self._update_blink_timer()
 
     def update(self, ask: Ask) -> None:
         self.question = ask.question
         self.options = ask.options
         self.selection = 0
         self.selected = False
-        self.refresh(recompose=True, layout=True)
+        if not self._update_in_place():
+            self.refresh(recompose=True, layout=True)
+
+    def _update_in_place(self) -> bool:
+        """Update the question and options without recomposing.
+
+        Only possible if the widgets match the new question and number of options.
+
+        Returns:
+            `True` if the widgets were updated, or `False` if a recompose is required.
+        """
+        try:
+            option_container = self.query_one("#option-container")
+        except NoMatches:
+            return False
+        prompt_labels = self.query("#prompt").results(Label)
+        prompt_label = next(prompt_labels, None)
+        if (prompt_label is not None) != bool(self.question):
+            return False
+        option_widgets = list(option_container.query_children(Option))
+        if len(option_widgets) != len(self.options):
+            return False
+        if prompt_label is not None:
+            prompt_label.update(self.question)
+        for option, answer, key in zip(
+            option_widgets, self.options, self._get_option_keys()
+        ):
+            option.update(Content(answer.text), key)
+        return True
+
+    def _get_option_keys(self) -> list[str | None]:
+        """Get the keys for the options (only the first option of each kind has a key).
+
+        Returns:
+            A list of keys, or `None` for no key, for each option.
+        """
+        kinds: set[str] = set()
+        keys: list[str | None] = []
+        for answer in self.options:
+            keys.append(
+                self.DEFAULT_KINDS.get(answer.kind)
+                if (answer.kind and answer.kind not in kinds)
+                else None
+            )
+            if answer.kind is not None:
+                kinds.add(answer.kind)
+        return keys
 
     def compose(self) -> ComposeResult:
         with containers.VerticalGroup():
@@ -240,29 +339,30 @@ class Question(Widget, can_focus=True):
                 yield Label(self.question, id="prompt")
 
             with containers.VerticalGroup(id="option-container"):
-                kinds: set[str] = set()
-                for index, answer in enumerate(self.options):
+                self._option_widgets = []
+                self._active_option = None
+                for index, (answer, key) in enumerate(
+                    zip(self.options, self._get_option_keys())
+                ):
                     active = index == self.selection
-                    key = (
-                        self.DEFAULT_KINDS.get(answer.kind)
-                        if (answer.kind and answer.kind not in kinds)
-                        else None
-                    )
-                    yield Option(
+                    option = Option(
                         index,
                         Content(answer.text),
                         key,
                         classes="-active" if active else "",
-                    ).data_bind(Question.selected)
-                    if answer.kind is not None:
-                        kinds.add(answer.kind)
+                    )
+                    self._option_widgets.append(option)
+                    if active:
+                        self._active_option = option
+                    yield option.data_bind(Question.selected)
 
     def watch_selection(self, old_selection: int, new_selection: int) -> None:
-        self.query("#option-container > .-active").remove_class("-active")
-        if new_selection >= 0:
-            self.query_one("#option-container").children[new_selection].add_class(
-                "-active"
-            )
+        if self._active_option is not None:
+            self._active_option.remove_class("-active")
+            self._active_option = None
+        if 0 <= new_selection < len(self._option_widgets):
+            self._active_option = self._option_widgets[new_selection]
+            self._active_option.add_class("-active")
 
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
         if self.selected and action in ("selection_up", "selection_down"):
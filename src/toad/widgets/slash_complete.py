@@ -10,6 +10,7 @@ from textual.content import Content, Span
 from textual import getters
 from textual.message import Message
 from textual.reactive import var
+from textual.timer import Timer
 from textual import containers
 from textual import widgets
 from textual.widgets.option_list import Option
@@ -51,6 +52,9 @@ class SlashComplete(containers.VerticalGroup):
     }
     """
 
+    FILTER_DELAY = 0.05
+    """Delay (in seconds) after the last keystroke before filtering commands."""
+
     input = getters.query_one(widgets.Input)
     option_list = getters.query_one(widgets.OptionList)
 
@@ -67,6 +71,13 @@ class SlashComplete(containers.VerticalGroup):
         classes: str | None = None,
     ) -> None:
         super().__init__(id=id, classes=classes)
+        self._rendered_commands: dict[tuple[str, str], tuple[Content, Content]] = {}
+        self._sorted_commands: list[tuple[str, SlashCommand]] = []
+        self._command_count = 0
+        self._command_letters: frozenset[str] = frozenset()
+        self._narrowed: tuple[str, list[tuple[str, SlashCommand]]] = ("", [])
+        self._filter_timer: Timer | None = None
+        self._options_key: tuple | None = None
         self.slash_commands = list(slash_commands) if slash_commands else []
         self.fuzzy_search = FuzzySearch(case_sensitive=False)
 
@@ -88,11 +99,65 @@ class SlashComplete(containers.VerticalGroup):
     @on(widgets.Input.Changed)
     def on_input_changed(self, event: widgets.Input.Changed) -> None:
         event.stop()
-        self.filter_slash_commands(event.value)
-
-    async def watch_slash_commands(self) -> None:
+        # Only filter once typing pauses; intermediate results wouldn't be seen
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(self.FILTER_DELAY, self._filter_input)
+
+    def _filter_input(self) -> None:
+        """Filter slash commands by the current input."""
+        self._filter_timer = None
         self.filter_slash_commands(self.input.value)
 
+    def _flush_filter(self) -> None:
+        """Apply a pending filter immediately, so actions see up to date options."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_input()
+
+    def watch_slash_commands(self, slash_commands: list[SlashCommand]) -> None:
+        self._rendered_commands.clear()
+        self._options_key = None
+        # Sort and casefold once here, rather than on every keystroke
+        self._sorted_commands = sorted(
+            [
+                (slash_command.command.casefold(), slash_command)
+                for slash_command in slash_commands
+            ],
+            key=itemgetter(0),
+        )
+        self._command_count = len(
+            {slash_command.command for slash_command in slash_commands}
+        )
+        # Every letter the fuzzy search could match
+        self._command_letters = frozenset(
+            "".join(
+                [slash_command.command[1:].lower() for slash_command in slash_commands]
+            )
+        )
+        self._narrowed = ("", self._sorted_commands)
+        if self.is_mounted:
+            self.filter_slash_commands(self.input.value)
+
+    def render_slash_command(
+        self, slash_command: SlashCommand
+    ) -> tuple[Content, Content]:
+        """Render the command and help columns for a slash command (cached).
+
+        Args:
+            slash_command: The slash command instance.
+
+        Returns:
+            A tuple of `Content` for the command and help text.
+        """
+        key = (slash_command.command, slash_command.help)
+        if (rendered := self._rendered_commands.get(key)) is None:
+            rendered = self._rendered_commands[key] = (
+                Content.styled(slash_command.command, "$text-success"),
+                Content.styled(slash_command.help, "dim"),
+            )
+        return rendered
+
     def filter_slash_commands(self, prompt: str) -> None:
         """Filter slash commands by the given prompt.
 
@@ -100,46 +165,37 @@ class SlashComplete(containers.VerticalGroup):
             prompt: Text prompt.
         """
         prompt = prompt.lstrip("/").casefold()
-        columns = self.columns = Columns("auto", "flex")
 
-        slash_commands = sorted(
-            self.slash_commands,
-            key=lambda slash_command: slash_command.command.casefold(),
-        )
-        deduplicated_slash_commands = {
-            slash_command.command: slash_command for slash_command in slash_commands
-        }
-        self.fuzzy_search.cache.grow(len(deduplicated_slash_commands))
+        sorted_commands = self._sorted_commands
+        self.fuzzy_search.cache.grow(self._command_count)
 
+        scores: list[tuple[float, Sequence[int], SlashCommand]]
         if prompt:
+            # A command which doesn't match a prompt can't match a longer prompt,
+            # so if the user typed more we only need to check the previous matches.
+            narrowed_prompt, candidates = self._narrowed
+            if not self._command_letters.issuperset(prompt.lower()):
+                # A letter no command contains, so nothing can match
+                candidates = []
+            elif not prompt.startswith(narrowed_prompt):
+                candidates = sorted_commands
             slash_prompt = f"/{prompt}"
-            scores: list[tuple[float, Sequence[int], SlashCommand]] = [
-                (
-                    *self.fuzzy_search.match(prompt, slash_command.command[1:]),
-                    slash_command,
-                )
-                for slash_command in slash_commands
-            ]
-
-            scores = sorted(
-                [
-                    (
-                        (
-                            score * 2
-                            if slash_command.command.casefold().startswith(slash_prompt)
-                            else score
-                        ),
-                        highlights,
-                        slash_command,
-                    )
-                    for score, highlights, slash_command in scores
-                    if score
-                ],
-                key=itemgetter(0),
-                reverse=True,
-            )
+            match = self.fuzzy_search.match
+            matches: list[tuple[str, SlashCommand]] = []
+            scores = []
+            for candidate in candidates:
+                folded_command, slash_command = candidate
+                score, highlights = match(prompt, slash_command.command[1:])
+                if score:
+                    matches.append(candidate)
+                    if folded_command.startswith(slash_prompt):
+                        score *= 2
+                    scores.append((score, highlights, slash_command))
+            self._narrowed = (prompt, matches)
+            scores.sort(key=itemgetter(0), reverse=True)
         else:
-            scores = [(1.0, [], slash_command) for slash_command in slash_commands]
+            self._narrowed = ("", sorted_commands)
+            scores = [(1.0, [], slash_command) for _, slash_command in sorted_commands]
 
         def make_row(
             slash_command: SlashCommand, indices: Iterable[int]
@@ -153,40 +209,59 @@ class SlashComplete(containers.VerticalGroup):
             Returns:
                 A tuple of `Content` instances for use as a column row.
             """
-            command = Content.styled(slash_command.command, "$text-success")
-            command = command.add_spans(
-                [Span(index + 1, index + 2, "underline not dim") for index in indices]
-            )
-            return (command, Content.styled(slash_command.help, "dim"))
-
-        rows = [
-            (
-                columns.add_row(
-                    *make_row(slash_command, indices),
-                ),
-                slash_command.command,
-            )
-            for _, indices, slash_command in scores
-        ]
-        self.option_list.set_options(
-            Option(row, id=command_name) for row, command_name in rows
+            command, help = self.render_slash_command(slash_command)
+            if indices:
+                command = command.add_spans(
+                    [
+                        Span(index + 1, index + 2, "underline not dim")
+                        for index in indices
+                    ]
+                )
+            return (command, help)
+
+        # Skip rebuilding the options if they would be identical
+        options_key = tuple(
+            [
+                (slash_command.command, slash_command.help, tuple(indices))
+                for _, indices, slash_command in scores
+            ]
         )
-        if self.display:
-            self.option_list.highlighted = 0
-        else:
-            with self.option_list.prevent(widgets.OptionList.OptionHighlighted):
-                self.option_list.highlighted = 0
+        option_list = self.option_list
+        with self.app.batch_update():
+            if options_key != self._options_key:
+                self._options_key = options_key
+                columns = self.columns = Columns("auto", "flex")
+                rows = [
+                    (
+                        columns.add_row(
+                            *make_row(slash_command, indices),
+                        ),
+                        slash_command.command,
+                    )
+                    for _, indices, slash_command in scores
+                ]
+                option_list.set_options(
+                    Option(row, id=command_name) for row, command_name in rows
+                )
+            if self.display:
+                option_list.highlighted = 0
+            else:
+                with option_list.prevent(widgets.OptionList.OptionHighlighted):
+                    option_list.highlighted = 0
 
     def action_cursor_down(self) -> None:
+        self._flush_filter()
         self.option_list.action_cursor_down()
 
     def action_cursor_up(self) -> None:
+        self._flush_filter()
         self.option_list.action_cursor_up()
 
     def action_dismiss(self) -> None:
         self.post_message(Dismiss(self))
 
     def action_submit(self) -> None:
+        self._flush_filter()
         if (option := self.option_list.highlighted_option) is not None:
             with self.input.prevent(widgets.Input.Changed):
                 self.input.clear()
@@ -25,10 +25,24 @@ class StrikeText(Widget):
         self.content = content
         super().__init__(name=name, id=id, classes=classes)
 
+    def update(self, content: Content) -> None:
+        """Replace the content.
+
+        Args:
+            content: New content.
+        """
+        self.content = content
+        self.refresh(layout=True)
+
     def strike(self) -> None:
         self.strike_time = monotonic()
         self.auto_refresh = 1 / 30
 
+    def reset_strike(self) -> None:
+        """Remove the strike-through and stop any running animation."""
+        self.strike_time = None
+        self.auto_refresh = None
+
     def render(self) -> Content:
         content = self.content
         if self.strike_time is not None:
@@ -1,18 +1,23 @@
 from dataclasses import dataclass
 
 from time import monotonic
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterable
+
+from rich.cells import cell_len
+from rich.segment import Segment
+from rich.style import Style as RichStyle
 
 from textual.cache import LRUCache
 
 from textual import on
 from textual import events
+from textual.content import Content
 from textual.css.query import NoMatches
 from textual.message import Message
 from textual.reactive import reactive
 from textual.selection import Selection
 from textual.style import Style
-from textual.geometry import Region, Size
+from textual.geometry import Offset, Region, Size
 from textual.scroll_view import ScrollView
 from textual.strip import Strip
 from textual.timer import Timer
@@ -24,6 +29,9 @@ from toad import ansi
 # Time required to double tab escape
 ESCAPE_TAP_DURATION = 400 / 1000
 
+# Characters sent per write when pasting
+PASTE_CHUNK_SIZE = 256
+
 
 class Terminal(ScrollView, can_focus=True):
     CURSOR_STYLE = Style.parse("reverse")
@@ -91,6 +99,9 @@ class Terminal(ScrollView, can_focus=True):
         self._alternate_screen: bool = False
 
         self._terminal_render_cache: LRUCache[tuple, Strip] = LRUCache(1024)
+        self._final_strip_cache: LRUCache[tuple, Strip] = LRUCache(1024)
+        self._selection_fold_cache: LRUCache[tuple, list] = LRUCache(256)
+        self._blank_strip_cache: LRUCache[tuple[int, RichStyle], Strip] = LRUCache(8)
         self._write_to_stdin: Callable[[str], Awaitable] | None = None
 
     @property
@@ -117,10 +128,19 @@ class Terminal(ScrollView, can_focus=True):
         return self._alternate_screen
 
     def notify_style_update(self) -> None:
-        """Clear cache when theme chages."""
-        self._terminal_render_cache.clear()
+        """Clear the selection cache when styles change.
+
+        Line renders are keyed on the visual style, so survive focus changes.
+        """
+        self._selection_fold_cache.clear()
         super().notify_style_update()
 
+    def _clear_render_caches(self) -> None:
+        """Clear cached line renders."""
+        self._terminal_render_cache.clear()
+        self._final_strip_cache.clear()
+        self._selection_fold_cache.clear()
+
     def set_state(self, state: ansi.TerminalState) -> None:
         """Set the terminal state, if this terminal is to inherit an existing state.
 
@@ -128,6 +148,7 @@ class Terminal(ScrollView, can_focus=True):
             state: Terminal state object.
         """
         self.state = state
+        self._clear_render_caches()
 
     def set_write_to_stdin(self, write_to_stdin: Callable[[str], Awaitable]) -> None:
         """Set a callable which is invoked with input, to be sent to stdin.
@@ -147,7 +168,7 @@ class Terminal(ScrollView, can_focus=True):
             self._finalized = True
             self.state.show_cursor = False
             self.add_class("-finalized")
-            self._terminal_render_cache.clear()
+            self._clear_render_caches()
             self.refresh()
             self.blur()
             self.post_message(self.Finalized(self))
@@ -165,9 +186,22 @@ class Terminal(ScrollView, can_focus=True):
         Returns:
             Tuple of extracted text and ending (typically "\n" or " "), or `None` if no text could be extracted.
         """
+        lines = self.state.buffer.lines
+        start, end = selection
+        # Only join the selected lines, rather than the entire scrollback
+        first_line = 0 if start is None else start.y
+        last_line = len(lines) if end is None else end.y
         text = "\n".join(
-            line_record.content.plain for line_record in self.state.buffer.lines
+            [
+                line_record.content.plain
+                for line_record in lines[first_line : last_line + 1]
+            ]
         )
+        if start is not None and first_line:
+            selection = Selection(
+                Offset(start.x, 0),
+                None if end is None else Offset(end.x, end.y - first_line),
+            )
         return selection.extract(text), "\n"
 
     def _on_resize(self, event: events.Resize) -> None:
@@ -181,6 +215,7 @@ class Terminal(ScrollView, can_focus=True):
         old_width = self._width
         old_height = self._height
         self._terminal_render_cache.grow(height * 2)
+        self._final_strip_cache.grow(height * 2)
         self._width = width or 80
         self._height = height or 24
         self._width = max(self._width, self.minimum_terminal_width)
@@ -199,8 +234,9 @@ class Terminal(ScrollView, can_focus=True):
             else:
                 conversation.shell.update_size(self._width, self._height)
 
+        # Refolded lines get new cache keys, so renders at the previous width are
+        # simply never looked up again, and will be evicted from the LRU caches.
         self.state.update_size(self._width, height)
-        self._terminal_render_cache.clear()
         self.refresh()
 
     def on_mount(self) -> None:
@@ -240,54 +276,116 @@ class Terminal(ScrollView, can_focus=True):
     def _update_from_state(
         self, scrollback_delta: set[int] | None, alternate_delta: set[int] | None
     ) -> None:
-        if self.state.current_directory:
-            self.current_directory = self.state.current_directory
+        state = self.state
+        scrollback_buffer = state.scrollback_buffer
+        alternate_buffer = state.alternate_buffer
+        if state.current_directory:
+            self.current_directory = state.current_directory
             self.finalize()
-        width = self.state.width
-        height = self.state.scrollback_buffer.height
-        if self.state.alternate_screen:
-            height += self.state.alternate_buffer.height
-        self.virtual_size = Size(min(self.state.buffer.max_line_width, width), height)
+        width = state.width
+        height = scrollback_buffer.height
+        if state.alternate_screen:
+            height += alternate_buffer.height
+        self.virtual_size = Size(min(state.buffer.max_line_width, width), height)
         if self._anchored and not self._anchor_released:
             self.scroll_y = self.max_scroll_y
 
+        window_width = self.region.width
+        if not window_width:
+            # Not on screen, it will be painted in full when it is laid out
+            return
+
         scroll_y = int(self.scroll_y)
-        visible_lines = frozenset(range(scroll_y, scroll_y + height))
+        # Compare against the bounds, rather than building a set of visible lines
+        visible_end = scroll_y + height
 
         if scrollback_delta is None and alternate_delta is None:
             self.refresh()
         else:
-            window_width = self.region.width
-            scrollback_height = self.state.scrollback_buffer.line_count
-            if scrollback_delta is None:
-                self.refresh(Region(0, 0, window_width, scrollback_height))
-            else:
-                refresh_lines = [
-                    Region(0, y - scroll_y, window_width, 1)
-                    for y in sorted(scrollback_delta & visible_lines)
-                ]
-                if refresh_lines:
-                    self.refresh(*refresh_lines)
-            alternate_height = self.state.alternate_buffer.line_count
-            if alternate_delta is None:
-                self.refresh(
-                    Region(
-                        0,
-                        scrollback_height - scroll_y,
-                        window_width,
-                        scrollback_height + alternate_height,
-                    )
+            scrollback_height = scrollback_buffer.line_count
+            self._refresh_delta(
+                scrollback_delta,
+                0,
+                Region(0, 0, window_width, scrollback_height),
+                scroll_y,
+                visible_end,
+            )
+            self._refresh_delta(
+                alternate_delta,
+                scrollback_height,
+                Region(
+                    0,
+                    scrollback_height - scroll_y,
+                    window_width,
+                    scrollback_height + alternate_buffer.line_count,
+                ),
+                scroll_y,
+                visible_end,
+            )
+
+    def _refresh_delta(
+        self,
+        delta: set[int] | None,
+        line_offset: int,
+        full_region: Region,
+        scroll_y: int,
+        visible_end: int,
+    ) -> None:
+        """Refresh the lines changed in one of the buffers.
+
+        Args:
+            delta: Changed line numbers, or `None` to refresh the whole buffer.
+            line_offset: Offset of the buffer's first line within the terminal.
+            full_region: Region to refresh for the whole buffer.
+            scroll_y: First visible line.
+            visible_end: Line after the last visible line.
+        """
+        if delta is None:
+            self.refresh(full_region)
+            return
+        lines: Iterable[int] = delta
+        if line_offset:
+            lines = [line_no + line_offset for line_no in delta]
+        if refresh_regions := self._get_refresh_regions(
+            lines, scroll_y, visible_end, full_region.width
+        ):
+            self.refresh(*refresh_regions)
+
+    @classmethod
+    def _get_refresh_regions(
+        cls, lines: Iterable[int], scroll_y: int, visible_end: int, width: int
+    ) -> list[Region]:
+        """Get the regions to refresh for changed lines.
+
+        Runs of consecutive lines are merged in to a single region.
+
+        Args:
+            lines: Changed line numbers.
+            scroll_y: First visible line.
+            visible_end: Line after the last visible line.
+            width: Width of the regions.
+
+        Returns:
+            A list of regions, relative to the scroll position.
+        """
+        regions: list[Region] = []
+        run_start = run_end = -1
+        # Sort in place, the filtered list is ours and typically small
+        visible_lines = [y for y in lines if scroll_y <= y < visible_end]
+        if len(visible_lines) > 1:
+            visible_lines.sort()
+        for y in visible_lines:
+            if y == run_end:
+                run_end += 1
+                continue
+            if run_end != -1:
+                regions.append(
+                    Region(0, run_start - scroll_y, width, run_end - run_start)
                 )
-            else:
-                alternate_delta = {
-                    line_no + scrollback_height for line_no in alternate_delta
-                }
-                refresh_lines = [
-                    Region(0, y - scroll_y, window_width, 1)
-                    for y in sorted(alternate_delta & visible_lines)
-                ]
-                if refresh_lines:
-                    self.refresh(*refresh_lines)
+            run_start, run_end = y, y + 1
+        if run_end != -1:
+            regions.append(Region(0, run_start - scroll_y, width, run_end - run_start))
+        return regions
 
     def render_line(self, y: int) -> Strip:
         scroll_x, scroll_y = self.scroll_offset
@@ -315,79 +413,136 @@ class Terminal(ScrollView, can_focus=True):
         # Get the folded line, which as a one to one relationship with y
         try:
             folded_line_ = buffer.folded_lines[y - buffer_offset]
-            line_no, line_offset, offset, line, updates = folded_line_
+            line_no, line_offset, offset, line, _updates = folded_line_
         except IndexError:
-            return Strip.blank(width, rich_style)
+            # Rows past the end of the buffer, which will be the same every frame
+            blank_key = (width, rich_style)
+            if (strip := self._blank_strip_cache.get(blank_key)) is None:
+                strip = Strip.blank(width, rich_style)
+                self._blank_strip_cache[blank_key] = strip
+            return strip
 
         line_record = buffer.lines[line_no]
-        cache_key: tuple | None = (
-            self.state.alternate_screen,
-            y,
-            line_record.updates,
-            updates,
-        )
-
-        # Add in cursor
+        # The line record's updates is unique to the line, and advances whenever it is
+        # changed or refolded, so with the fold index it identifies the folded content.
+        # The visual style is included so that focus changes don't invalidate renders.
+        cache_key: tuple | None = (line_record.updates, line_offset, visual_style)
+
+        # The cursor is overlaid on the cached strip, so the cursor row still hits the cache
+        cursor_offset: int | None = None
+        # Test the row first, as it fails for all but one row
         if (
-            not self.hide_cursor
+            buffer.cursor_line == y - buffer_offset
             and state.show_cursor
-            and buffer.cursor_line == y - buffer_offset
+            and not self.hide_cursor
         ):
-            if buffer.cursor_offset >= len(line):
-                line = line.pad_right(buffer.cursor_offset - len(line) + 1)
-            line_cursor_offset = buffer.cursor_offset
-            line = line.stylize(
-                self.CURSOR_STYLE, line_cursor_offset, line_cursor_offset + 1
-            )
-            cache_key = None
+            cursor_offset = buffer.cursor_offset
 
-        # get cached strip if there is no selection
-        if (
-            not selection
-            and cache_key is not None
-            and (strip := self._terminal_render_cache.get(cache_key))
-        ):
-            strip = strip.crop(x, x + width)
-            strip = strip.adjust_cell_length(
+        # Blank lines (common in scrollback) need no rendering
+        if cursor_offset is None and not line.cell_length:
+            return Strip.blank(
                 width, (visual_style + line_record.style).rich_style
-            )
-            strip = strip.apply_offsets(x + offset, line_no)
-            return strip
+            ).apply_offsets(x + offset, line_no)
+
+        # get cached strip if there is no selection
+        final_cache_key: tuple | None = None
+        if not selection:
+            if cursor_offset is None:
+                # The finished strip, so unchanged lines skip cropping and offsets
+                final_cache_key = (
+                    cache_key,
+                    x,
+                    width,
+                    offset,
+                    line_no,
+                    line_record.style,
+                    visual_style,
+                )
+                if (strip := self._final_strip_cache.get(final_cache_key)) is not None:
+                    return strip
+            strip = self._terminal_render_cache.get(cache_key)
+        else:
+            strip = None
 
         # Apply selection
         if selection is not None and (select_span := selection.get_span(line_no)):
-            unfolded_content = line_record.content.expand_tabs(8)
-            start, end = select_span
-            if end == -1:
-                end = len(unfolded_content)
-            selection_style = self.screen.get_visual_style("screen--selection")
-            unfolded_content = unfolded_content.stylize(selection_style, start, end)
-            try:
+            # Each fold of the line, on every frame, shares one selected refold
+            selection_key = (line_record.updates, select_span, width)
+            folded_lines = self._selection_fold_cache.get(selection_key)
+            if folded_lines is None:
+                unfolded_content = line_record.content.expand_tabs(8)
+                start, end = select_span
+                if end == -1:
+                    end = len(unfolded_content)
+                selection_style = self.screen.get_visual_style("screen--selection")
+                unfolded_content = unfolded_content.stylize(selection_style, start, end)
                 folded_lines = self.state._fold_line(line_no, unfolded_content, width)
+                self._selection_fold_cache[selection_key] = folded_lines
+            try:
                 line = folded_lines[line_offset].content
                 cache_key = None
+                # The cursor isn't drawn over a selection
+                cursor_offset = None
             except IndexError:
                 pass
 
-        try:
-            strip = Strip(
-                line.render_segments(visual_style), cell_length=line.cell_length
-            )
-        except Exception:
-            # TODO: Is this neccesary?
-            strip = Strip.blank(line.cell_length)
+        if strip is None:
+            try:
+                strip = Strip(
+                    line.render_segments(visual_style), cell_length=line.cell_length
+                )
+            except Exception:
+                # TODO: Is this neccesary?
+                strip = Strip.blank(line.cell_length)
+
+            if cache_key is not None:
+                self._terminal_render_cache[cache_key] = strip
 
-        if cache_key is not None:
-            self._terminal_render_cache[cache_key] = strip
+        if cursor_offset is not None:
+            strip = self._overlay_cursor(strip, line, cursor_offset, rich_style)
 
         strip = strip.crop(x, x + width)
         strip = strip.adjust_cell_length(
             width, (visual_style + line_record.style).rich_style
         )
         strip = strip.apply_offsets(x + offset, line_no)
+        if final_cache_key is not None:
+            self._final_strip_cache[final_cache_key] = strip
 
         return strip
 
+    def _overlay_cursor(
+        self, strip: Strip, line: Content, cursor_offset: int, style: RichStyle
+    ) -> Strip:
+        """Draw the cursor over a rendered line.
+
+        Args:
+            strip: Strip rendered from `line`, without a cursor.
+            line: Content of the line.
+            cursor_offset: Offset of the cursor within the line.
+            style: Style used to pad the strip if the cursor is past the end.
+
+        Returns:
+            A new strip with the cursor cell in the cursor style.
+        """
+        if cursor_offset < len(line):
+            cursor_cell = strip.index_to_cell_position(cursor_offset)
+            cursor_width = max(1, cell_len(line.plain[cursor_offset]))
+        else:
+            cursor_cell = line.cell_length + cursor_offset - len(line)
+            cursor_width = 1
+        cursor_end = cursor_cell + cursor_width
+        if strip.cell_length < cursor_end:
+            strip = strip.extend_cell_length(cursor_end, style)
+        before, cursor, after = strip.divide(
+            [cursor_cell, cursor_end, strip.cell_length]
+        )
+        cursor_style = self.CURSOR_STYLE.rich_style
+        cursor = Strip(
+            Segment.apply_style(cursor, post_style=cursor_style), cursor.cell_length
+        )
+        return Strip.join([before, cursor, after])
+
     async def _reset_escaping(self) -> None:
         if self._escaping:
             await self.write_process_stdin(self.state.key_escape())
@@ -484,8 +639,10 @@ class Terminal(ScrollView, can_focus=True):
                 await self.write_process_stdin(self._encode_mouse_event_sgr(event))
 
     async def on_paste(self, event: events.Paste) -> None:
-        for character in event.text:
-            await self.write_process_stdin(character)
+        # Send in chunks rather than per character, small enough not to flood the pty
+        text = event.text
+        for offset in range(0, len(text), PASTE_CHUNK_SIZE):
+            await self.write_process_stdin(text[offset : offset + PASTE_CHUNK_SIZE])
 
     async def write_process_stdin(self, input: str) -> None:
         if self._write_to_stdin is not None:
@@ -7,8 +7,8 @@ import fcntl
 import os
 import pty
 import shlex
-from collections import deque
 from dataclasses import dataclass
+from functools import cached_property
 import struct
 import termios
 from typing import Mapping
@@ -19,8 +19,11 @@ from textual.reactive import var
 from toad.shell_read import shell_read
 from toad.widgets.terminal import Terminal
 
+# The winsize struct expected by TIOCSWINSZ
+WINSIZE_STRUCT = struct.Struct("HHHH")
 
-@dataclass
+
+@dataclass(frozen=True)
 class Command:
     """A command and corresponding environment."""
 
@@ -33,9 +36,13 @@ class Command:
     cwd: str
     """Current working directory."""
 
+    @cached_property
+    def _command_str(self) -> str:
+        """The command and arguments as a shell command line."""
+        return shlex.join([self.command, *self.args]).strip("'")
+
     def __str__(self) -> str:
-        command_str = shlex.join([self.command, *self.args]).strip("'")
-        return command_str
+        return self._command_str
 
 
 @dataclass
@@ -79,11 +86,10 @@ class TerminalTool(Terminal):
         self._command = command
         self._output_byte_limit = output_byte_limit
         self._command_task: asyncio.Task | None = None
-        self._output: deque[bytes] = deque()
+        self._output = bytearray()
 
         self._process: Process | None = None
         self._bytes_read = 0
-        self._output_bytes_count = 0
         self._shell_fd: int | None = None
         self._return_code: int | None = None
         self._released: bool = False
@@ -119,12 +125,14 @@ class TerminalTool(Terminal):
             rows: Rows (height).
         """
         # Pack the dimensions into the format expected by TIOCSWINSZ
-        size = struct.pack("HHHH", rows, columns, 0, 0)
+        size = WINSIZE_STRUCT.pack(rows, columns, 0, 0)
         fcntl.ioctl(fd, termios.TIOCSWINSZ, size)
 
     async def wait_for_exit(self) -> tuple[int | None, str | None]:
         """Wait for the terminal process to exit."""
-        if self._process is None or self._command_task is None:
+        if self._command_task is None:
+            return None, None
+        if self._process is None and self._return_code is None:
             return None, None
         # await self._task
         await self._exit_event.wait()
@@ -180,8 +188,7 @@ class TerminalTool(Terminal):
         master, slave = pty.openpty()
         self._shell_fd = master
 
-        flags = fcntl.fcntl(master, fcntl.F_GETFL)
-        fcntl.fcntl(master, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        os.set_blocking(master, False)
 
         command = self._command
         environment = os.environ | command.env
@@ -192,10 +199,12 @@ class TerminalTool(Terminal):
             run_command = f"{command.command} {shlex.join(command.args)}"
 
         shell = os.environ.get("SHELL", "sh")
-        run_command = shlex.join([shell, "-c", run_command])
 
         try:
-            process = self._process = await asyncio.create_subprocess_shell(
+            # Exec the shell directly, rather than via /bin/sh which would only re-split it
+            process = self._process = await asyncio.create_subprocess_exec(
+                shell,
+                "-c",
                 run_command,
                 stdin=slave,
                 stdout=slave,
@@ -203,6 +212,21 @@ class TerminalTool(Terminal):
                 env=environment,
                 cwd=command.cwd,
             )
+        except OSError as error:
+            # The shell couldn't be started; report it as a shell would (exit 127)
+            os.close(slave)
+            os.close(master)
+            self._shell_fd = None
+            message = f"{shell}: {error.strerror or error}\r\n"
+            self._record_output(message.encode("utf-8", "replace"))
+            await self.write(message)
+            self.display = True
+            self.finalize()
+            self._return_code = 127
+            self._ready_event.set()
+            self.add_class("-error")
+            self.border_title = Content.assemble(f"{command} [127]")
+            return
         except Exception as error:
             self._ready_event.set()
             print(error)
@@ -221,17 +245,10 @@ class TerminalTool(Terminal):
         reader = asyncio.StreamReader(BUFFER_SIZE)
         protocol = asyncio.StreamReaderProtocol(reader)
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         transport, _ = await loop.connect_read_pipe(
             lambda: protocol, os.fdopen(master, "rb", 0)
         )
-        # Create write transport
-        writer_protocol = asyncio.BaseProtocol()
-        write_transport, _ = await loop.connect_write_pipe(
-            lambda: writer_protocol,
-            os.fdopen(os.dup(master), "wb", 0),
-        )
-        self.writer = write_transport
 
         unicode_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         try:
@@ -239,7 +256,7 @@ class TerminalTool(Terminal):
                 data = await shell_read(reader, BUFFER_SIZE)
                 if process_data := unicode_decoder.decode(data, final=not data):
                     self._record_output(data)
-                    if await self.write(process_data):
+                    if await self.write(process_data) and not self.display:
                         self.display = True
                 if not data:
                     break
@@ -264,20 +281,19 @@ class TerminalTool(Terminal):
 
         """
 
-        self._output.append(data)
-        self._output_bytes_count += len(data)
+        output = self._output
+        output.extend(data)
         self._bytes_read += len(data)
 
         if self._output_byte_limit is None:
             return
+        if self._output_byte_limit <= 0:
+            output.clear()
+            return
 
-        while self._output_bytes_count > self._output_byte_limit and self._output:
-            oldest_bytes = self._output[0]
-            oldest_bytes_count = len(oldest_bytes)
-            if self._output_bytes_count - oldest_bytes_count < self._output_byte_limit:
-                break
-            self._output.popleft()
-            self._output_bytes_count -= oldest_bytes_count
+        # Trim only once there is twice the limit, so trimming is amortized over writes
+        if len(output) > self._output_byte_limit * 2:
+            del output[: -self._output_byte_limit]
 
     def get_output(self) -> tuple[str, bool]:
         """Get the output.
@@ -285,33 +301,30 @@ class TerminalTool(Terminal):
         Returns:
             A tuple of the output and a bool to indicate if the output was truncated.
         """
-        output_bytes = b"".join(self._output)
+        output_bytes = self._output
 
-        def is_continuation(byte_value: int) -> bool:
-            """Check if the given byte is a utf-8 continuation byte.
-
-            Args:
-                byte_value: Ordinal of the byte.
-
-            Returns:
-                `True` if the byte is a continuation, or `False` if it is the start of a character.
-            """
-            return (byte_value & 0b11000000) == 0b10000000
+        if self._output_byte_limit is not None and self._output_byte_limit <= 0:
+            return "", self._bytes_read > 0
 
         truncated = False
         if (
             self._output_byte_limit is not None
-            and len(output_bytes) > self._output_byte_limit
+            and self._bytes_read > self._output_byte_limit
         ):
             truncated = True
             output_bytes = output_bytes[-self._output_byte_limit :]
             # Must start on a utf-8 boundary
-            # Discard initial bytes that aren't a utf-8 continuation byte.
-            for offset, byte_value in enumerate(output_bytes):
-                if not is_continuation(byte_value):
-                    if offset:
-                        output_bytes = output_bytes[offset:]
-                    break
+            # Discard initial utf-8 continuation bytes (a character has at most 3).
+            offset = 0
+            output_length = len(output_bytes)
+            while (
+                offset < 3
+                and offset < output_length
+                and (output_bytes[offset] & 0b11000000) == 0b10000000
+            ):
+                offset += 1
+            if offset and offset < output_length:
+                output_bytes = output_bytes[offset:]
 
         output = output_bytes.decode("utf-8", "replace")
         return output, truncated
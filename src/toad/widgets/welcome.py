@@ -1,5 +1,6 @@
 from textual.app import ComposeResult
 from textual import containers
+from textual.content import Content
 
 from textual.widgets import Label, Markdown
 
@@ -14,6 +15,9 @@ ASCII_TOAD = r"""
    )_/ /|\   /|\ \_(
 """
 
+# Built once, and as plain text, so the logo isn't parsed as markup on each mount
+ASCII_TOAD_CONTENT = Content(ASCII_TOAD)
+
 
 WELCOME_MD = """\
 ## Toad v1.0
@@ -27,5 +31,5 @@ Welcome, **Will**!
 class Welcome(containers.Vertical):
     def compose(self) -> ComposeResult:
         with containers.Center():
-            yield Label(ASCII_TOAD, id="logo")
+            yield Label(ASCII_TOAD_CONTENT, id="logo")
         yield Markdown(WELCOME_MD, id="message", classes="note")
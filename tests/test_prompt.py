@@ -0,0 +1,39 @@
+import shlex
+import unittest
+
+from toad.widgets.prompt import _last_shell_token
+
+
+class TestLastShellToken(unittest.TestCase):
+    def test_matches_shlex(self) -> None:
+        for text in [
+            "",
+            "   ",
+            "ls",
+            "ls ",
+            "cd src/toad",
+            "cat my\\ file.txt",
+            "cat my\\ ",
+            "cat 'my file.txt'",
+            'cat "my file.txt" other',
+            "echo a\\\\ b",
+        ]:
+            with self.subTest(text=text):
+                tokens = shlex.split(text)
+                self.assertEqual(_last_shell_token(text), tokens[-1] if tokens else "")
+
+    def test_unbalanced(self) -> None:
+        for text, expected in [
+            ("cat 'my fi", "my fi"),
+            ('cat "my fi', "my fi"),
+            ("cat \"it's", "it's"),
+            ("cat foo\\", "foo"),
+            ("cat \\", ""),
+            ("cat 'a b' \"c", "c"),
+        ]:
+            with self.subTest(text=text):
+                self.assertEqual(_last_shell_token(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
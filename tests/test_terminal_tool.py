@@ -0,0 +1,42 @@
+import unittest
+
+from toad.widgets.terminal_tool import Command, TerminalTool
+
+
+def make_terminal_tool(output_byte_limit: int | None) -> TerminalTool:
+    return TerminalTool(
+        Command("true", [], {}, "."), output_byte_limit=output_byte_limit
+    )
+
+
+class TestOutputLimit(unittest.TestCase):
+    def test_no_limit(self) -> None:
+        terminal_tool = make_terminal_tool(None)
+        terminal_tool._record_output(b"hello ")
+        terminal_tool._record_output(b"world")
+        self.assertEqual(terminal_tool.get_output(), ("hello world", False))
+
+    def test_limit(self) -> None:
+        terminal_tool = make_terminal_tool(5)
+        for _ in range(10):
+            terminal_tool._record_output(b"hello world")
+        self.assertEqual(terminal_tool.get_output(), ("world", True))
+        self.assertLessEqual(len(terminal_tool._output), 10)
+
+    def test_limit_utf8_boundary(self) -> None:
+        terminal_tool = make_terminal_tool(3)
+        terminal_tool._record_output("a€b".encode())
+        # The limit falls within "€", which is discarded rather than decoded in part
+        self.assertEqual(terminal_tool.get_output(), ("b", True))
+
+    def test_limit_zero(self) -> None:
+        terminal_tool = make_terminal_tool(0)
+        self.assertEqual(terminal_tool.get_output(), ("", False))
+        for _ in range(10):
+            terminal_tool._record_output(b"hello world")
+        self.assertEqual(terminal_tool.get_output(), ("", True))
+        self.assertFalse(terminal_tool._output)
+
+
+if __name__ == "__main__":
+    unittest.main()